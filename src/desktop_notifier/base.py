@@ -5,10 +5,25 @@ must inherit from :class:`DesktopNotifierBase`.
 """
 
 # system imports
+import sys
 import logging
-from enum import Enum
+import warnings
+import asyncio
+from enum import IntEnum
 from collections import deque
-from typing import Optional, Dict, Callable, Any, Union, Deque, List, Sequence
+from itertools import islice
+from typing import (
+    Optional,
+    Dict,
+    Deque,
+    Callable,
+    Any,
+    Union,
+    List,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 try:
     from importlib.resources import files  # type: ignore
@@ -25,20 +40,60 @@ class AuthorisationError(Exception):
     """Raised when we are not authorised to send notifications"""
 
 
-class Urgency(Enum):
+class Urgency(IntEnum):
     """Enumeration of notification levels
 
-    The interpretation and visuals will depend on the platform.
+    The interpretation and visuals will depend on the platform. Values correspond to
+    the urgency levels of the freedesktop.org notification specification. Levels are
+    ordered and can be compared, e.g., ``urgency >= Urgency.Normal``.
+
+    .. versionchanged:: 3.3
+       Values are integers instead of the lowercase strings "low", "normal" and
+       "critical". Use :attr:`legacy_name` to get the previous string value. Looking up
+       a level by its previous string value, e.g., ``Urgency("critical")``, is
+       deprecated. Converting a level to a string still gives its qualified name, e.g.,
+       ``"Urgency.Low"``.
     """
 
-    Critical = "critical"
-    """For critical errors."""
+    Low = 0
+    """Low priority notification."""
 
-    Normal = "normal"
+    Normal = 1
     """Default platform notification level."""
 
-    Low = "low"
-    """Low priority notification."""
+    Critical = 2
+    """For critical errors."""
+
+    @property
+    def legacy_name(self) -> str:
+        """The lowercase string which was used as value before version 3.3."""
+        return self.name.lower()
+
+    def __bool__(self) -> bool:
+        # Keep all levels truthy, as they were before values became integers.
+        return True
+
+    def __str__(self) -> str:
+        # Keep the string representation of the previous str-valued enum instead of
+        # the integer value which IntEnum uses on Python 3.11 and later.
+        return f"{type(self).__name__}.{self.name}"
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["Urgency"]:
+        for urgency in cls:
+            if urgency.legacy_name == value:
+                warnings.warn(
+                    "Looking up urgency levels by string value is deprecated, use "
+                    f"Urgency.{urgency.name} instead",
+                    DeprecationWarning,
+                    # Skip EnumMeta.__call__ and Enum.__new__ to blame the caller.
+                    stacklevel=4,
+                )
+                return urgency
+        return None
 
 
 class Button:
@@ -103,6 +158,22 @@ class Notification:
     :param thread: An identifier to group related notifications together.
     """
 
+    __slots__ = (
+        "identifier",
+        "title",
+        "message",
+        "urgency",
+        "icon",
+        "buttons",
+        "reply_field",
+        "on_clicked",
+        "on_dismissed",
+        "attachment",
+        "sound",
+        "thread",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         title: str,
@@ -118,34 +189,31 @@ class Notification:
         thread: Optional[str] = None,
     ) -> None:
 
-        self._identifier: Union[str, int, None] = None
+        self.identifier: Union[str, int, None] = None
+        """
+        A platform identifier which gets assigned to the notification after it was
+        sent. This may be a str or int.
+        """
+
         self.title = title
         self.message = message
         self.urgency = urgency
         self.icon = icon
-        self.buttons = buttons
+        self.buttons: Tuple[Button, ...] = tuple(buttons)
         self.reply_field = reply_field
         self.on_clicked = on_clicked
         self.on_dismissed = on_dismissed
         self.attachment = attachment
         self.sound = sound
-        self.thread = thread
-
-    @property
-    def identifier(self) -> Union[str, int, None]:
-        """
-        An platform identifier which gets assigned to the notification after it was
-        sent. This may be a str or int.
-        """
-        return self._identifier
-
-    @identifier.setter
-    def identifier(self, value: Union[str, int, None]) -> None:
-        """Setter: identifier"""
-        self._identifier = value
+        # Thread identifiers are typically shared by many notifications.
+        self.thread = sys.intern(thread) if thread is not None else None
 
     def __repr__(self):
-        return f"<{self.__class__.__name__}(title='{self.title}', message='{self.message}')>"
+        return "<%s(title=%r, message=%r)>" % (
+            type(self).__name__,
+            self.title,
+            self.message,
+        )
 
 
 class DesktopNotifierBase:
@@ -166,8 +234,26 @@ class DesktopNotifierBase:
         self.app_name = app_name
         self.app_icon = app_icon
         self.notification_limit = notification_limit
-        self._current_notifications: Deque[Notification] = deque([], notification_limit)
-        self._notification_for_nid: Dict[Union[str, int], Notification] = {}
+
+        # Displayed notifications by platform ID, in the order in which they were sent.
+        self._notifications: Dict[Union[str, int], Notification] = {}
+        self._current_notifications_cache: Optional[Tuple[Notification, ...]] = None
+
+        # Notifications which have been queued by send() but not yet dispatched to the
+        # platform, and the task which is dispatching them.
+        self._pending: Deque[Notification] = deque()
+        self._pending_append = self._pending.append
+        self._pending_popleft = self._pending.popleft
+        self._worker: Optional[asyncio.Future] = None
+
+        # Only the bounded case needs to look up notifications to replace.
+        self._next_batch: Callable[
+            [], List[Tuple[Notification, Optional[Notification]]]
+        ]
+        if notification_limit is None:
+            self._next_batch = self._next_batch_unbounded
+        else:
+            self._next_batch = self._next_batch_bounded
 
     async def request_authorisation(self) -> bool:
         """
@@ -186,20 +272,51 @@ class DesktopNotifierBase:
     async def send(self, notification: Notification) -> None:
         """
         Sends a desktop notification. Some arguments may be ignored, depending on the
-        implementation. This is a wrapper method which mostly performs housekeeping of
-        notifications ID and calls :meth:`_send` to actually schedule the notification.
-        Platform implementations must implement :meth:`_send`.
+        implementation. This is a wrapper method which queues the notification and
+        returns immediately. Notifications are dispatched in order by a background task
+        which calls :meth:`_send_many` to actually schedule the notifications and
+        performs housekeeping of notifications ID. Platform implementations must implement
+        :meth:`_send` and may implement :meth:`_send_many`.
+
+        Use :meth:`flush` to wait until the notification has been dispatched and its
+        identifier has been set.
 
         :param notification: Notification to send.
         """
 
-        notification_to_replace: Optional[Notification]
+        self._pending_append(notification)
 
-        if len(self._current_notifications) == self.notification_limit:
-            notification_to_replace = self._current_notifications.popleft()
-        else:
-            notification_to_replace = None
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._dispatch_pending())
+
+    async def flush(self) -> None:
+        """
+        Waits until all notifications queued by :meth:`send` have been dispatched.
+        """
+        if self._worker and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    async def _dispatch_pending(self) -> None:
+        """Dispatches queued notifications in batches until the queue is empty."""
+        while self._pending:
+            try:
+                await self._send_many(self._next_batch())
+            except Exception:
+                # For instance, the platform service could not be reached at all.
+                logger.warning("Notification failed", exc_info=True)
+
+    async def _dispatch(
+        self,
+        notification: Notification,
+        notification_to_replace: Optional[Notification],
+    ) -> None:
+        """
+        Sends a single notification via :meth:`_send` and records it in our cache as
+        soon as it has been delivered, such that callbacks for it can be handled.
 
+        :param notification: Notification to send.
+        :param notification_to_replace: Notification to replace, if any.
+        """
         try:
             platform_nid = await self._send(notification, notification_to_replace)
         except Exception:
@@ -207,29 +324,68 @@ class DesktopNotifierBase:
             # The dbus service may not be available, we might be in a headless session,
             # etc. Since notifications are not critical to an application, we only emit
             # a warning.
-            if notification_to_replace:
-                self._current_notifications.appendleft(notification_to_replace)
             logger.warning("Notification failed", exc_info=True)
-        else:
-            notification.identifier = platform_nid
-            self._current_notifications.append(notification)
-            self._notification_for_nid[platform_nid] = notification
+            return
+
+        if notification_to_replace:
+            self._clear_notification_from_cache(notification_to_replace)
+
+        notification.identifier = platform_nid
+        self._notifications[platform_nid] = notification
+        self._current_notifications_cache = None
+
+    def _next_batch_unbounded(
+        self,
+    ) -> List[Tuple[Notification, Optional[Notification]]]:
+        """
+        Takes all notifications from the queue. Without a notification limit, no
+        notification replaces another one.
+        """
+        return [(self._pending_popleft(), None) for _ in range(len(self._pending))]
+
+    def _next_batch_bounded(self) -> List[Tuple[Notification, Optional[Notification]]]:
+        """
+        Takes the next batch of notifications from the queue. Each notification is
+        paired with the notification it replaces, if any. Batches are never larger than
+        the notification limit, such that all replaced notifications are in our cache.
+        """
+        limit = cast(int, self.notification_limit)
+        size = min(len(self._pending), max(limit, 1))
+        batch = [self._pending_popleft() for _ in range(size)]
+
+        excess = len(self._notifications) + size - limit
+        oldest = list(islice(self._notifications.values(), max(excess, 0)))
+        to_replace: List[Optional[Notification]] = [None] * (size - len(oldest))
+        to_replace.extend(oldest)
+
+        return list(zip(batch, to_replace))
 
     def _clear_notification_from_cache(self, notification: Notification) -> None:
         """
         Removes the notification from our cache. Should be called by backends when the
         notification is closed.
         """
-        try:
-            self._current_notifications.remove(notification)
-        except ValueError:
-            pass
-
         if notification.identifier:
-            try:
-                self._notification_for_nid.pop(notification.identifier)
-            except KeyError:
-                pass
+            self._notifications.pop(notification.identifier, None)
+            self._current_notifications_cache = None
+
+    async def _send_many(
+        self,
+        notifications: List[Tuple[Notification, Optional[Notification]]],
+    ) -> None:
+        """
+        Method to send a batch of notifications via the platform. The default
+        implementation dispatches each notification in turn. Subclasses may override
+        this to dispatch notifications concurrently.
+
+        Implementations must send each notification with :meth:`_dispatch`, which
+        records it as soon as it has been delivered and logs any failure.
+
+        :param notifications: Pairs of a notification to send and the notification to
+            replace, if any.
+        """
+        for notification, notification_to_replace in notifications:
+            await self._dispatch(notification, notification_to_replace)
 
     async def _send(
         self,
@@ -252,11 +408,14 @@ class DesktopNotifierBase:
         raise NotImplementedError()
 
     @property
-    def current_notifications(self) -> List[Notification]:
+    def current_notifications(self) -> Tuple[Notification, ...]:
         """
-        A list of all notifications which currently displayed in the notification center
+        A tuple of all notifications which are currently displayed in the notification
+        center. The tuple is built once and reused until the next change.
         """
-        return list(self._current_notifications)
+        if self._current_notifications_cache is None:
+            self._current_notifications_cache = tuple(self._notifications.values())
+        return self._current_notifications_cache
 
     async def clear(self, notification: Notification) -> None:
         """
@@ -268,9 +427,13 @@ class DesktopNotifierBase:
         :param notification: Notification to clear.
         """
 
-        if notification.identifier:
-            await self._clear(notification)
+        await self.flush()
+
+        if not notification.identifier:
+            # The notification was never delivered and therefore is not in our cache.
+            return
 
+        await self._clear(notification)
         self._clear_notification_from_cache(notification)
 
     async def _clear(self, notification: Notification) -> None:
@@ -290,9 +453,10 @@ class DesktopNotifierBase:
         must implement :meth:`_clear_all`.
         """
 
+        await self.flush()
         await self._clear_all()
-        self._current_notifications.clear()
-        self._notification_for_nid.clear()
+        self._notifications.clear()
+        self._current_notifications_cache = None
 
     async def _clear_all(self) -> None:
         """
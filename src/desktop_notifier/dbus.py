@@ -6,8 +6,9 @@ event loop.
 """
 
 # system imports
+import asyncio
 import logging
-from typing import Optional, TypeVar
+from typing import Optional, TypeVar, List, Tuple
 
 # external imports
 from dbus_next import Variant  # type: ignore
@@ -44,11 +45,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         notification center.
     """
 
-    _to_native_urgency = {
-        Urgency.Low: Variant("y", 0),
-        Urgency.Normal: Variant("y", 1),
-        Urgency.Critical: Variant("y", 2),
-    }
+    _to_native_urgency = {urgency: Variant("y", urgency.value) for urgency in Urgency}
 
     def __init__(
         self,
@@ -98,6 +95,24 @@ class DBusDesktopNotifier(DesktopNotifierBase):
 
         return self.interface
 
+    async def _send_many(
+        self,
+        notifications: List[Tuple[Notification, Optional[Notification]]],
+    ) -> None:
+        """
+        Asynchronously sends a batch of notifications via the Dbus interface. Method
+        calls for all notifications are issued concurrently.
+
+        :param notifications: Pairs of a notification to send and the notification to
+            replace, if any.
+        """
+        if not self.interface:
+            self.interface = await self._init_dbus()
+
+        await asyncio.gather(
+            *(self._dispatch(n, to_replace) for n, to_replace in notifications)
+        )
+
     async def _send(
         self,
         notification: Notification,
@@ -137,7 +152,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         platform_nid = await self.interface.call_notify(
             self.app_name,  # app_name
             replaces_nid,  # replaces_id
-            notification.icon or "",  # app_icon
+            notification.icon or self.app_icon or "",  # app_icon
             notification.title,  # summary
             notification.message,  # body
             actions,  # actions
@@ -186,7 +201,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         # Get the notification instance from the platform ID.
         nid = int(nid)
         action_key = str(action_key)
-        notification = self._notification_for_nid.get(nid)
+        notification = self._notifications.get(nid)
 
         # Execute any callbacks for button clicks.
         if notification:
@@ -213,7 +228,7 @@ class DBusDesktopNotifier(DesktopNotifierBase):
         # Get the notification instance from the platform ID.
         nid = int(nid)
         reason = int(reason)
-        notification = self._notification_for_nid.get(nid)
+        notification = self._notifications.get(nid)
 
         # Execute callback for user dismissal.
         if notification:
@@ -96,7 +96,14 @@ class NotificationCenterDelegate(NSObject):  # type: ignore
 
         # Get the notification which was clicked from the platform ID.
         platform_nid = py_from_ns(response.notification.request.identifier)
-        py_notification = self.interface._notification_for_nid[platform_nid]
+        py_notification = self.interface._notifications.get(platform_nid)
+
+        if not py_notification:
+            # The notification is no longer in our cache, e.g., it was replaced.
+            logger.debug("Received response for unknown notification %s", platform_nid)
+            completion_handler()
+            return
+
         py_notification = cast(Notification, py_notification)
 
         self.interface._clear_notification_from_cache(py_notification)
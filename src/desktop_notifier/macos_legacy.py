@@ -49,7 +49,13 @@ class NotificationCenterDelegate(NSObject):  # type: ignore
     ) -> None:
 
         platform_nid = py_from_ns(notification.identifier)
-        py_notification = self.interface._notification_for_nid[platform_nid]
+        py_notification = self.interface._notifications.get(platform_nid)
+
+        if not py_notification:
+            # The notification is no longer in our cache, e.g., it was replaced.
+            logger.debug("Received response for unknown notification %s", platform_nid)
+            return
+
         py_notification = cast(Notification, py_notification)
 
         self.interface._clear_notification_from_cache(py_notification)
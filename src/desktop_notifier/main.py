@@ -17,7 +17,7 @@ from typing import (
     Optional,
     Callable,
     Coroutine,
-    List,
+    Tuple,
     Any,
     TypeVar,
     Sequence,
@@ -296,6 +296,7 @@ class DesktopNotifier:
                 await self.request_authorisation()
 
             await self._impl.send(notification)
+            await self._impl.flush()
 
             return notification
 
@@ -336,8 +337,13 @@ class DesktopNotifier:
         return self._run_coro_sync(coro)
 
     @property
-    def current_notifications(self) -> List[Notification]:
-        """A list of all currently displayed notifications for this app"""
+    def current_notifications(self) -> Tuple[Notification, ...]:
+        """
+        A tuple of all currently displayed notifications for this app.
+
+        .. versionchanged:: 3.3
+           Returns a tuple instead of a list.
+        """
         return self._impl.current_notifications
 
     async def clear(self, notification: Notification) -> None:
@@ -0,0 +1,259 @@
+import asyncio
+
+import pytest
+
+from desktop_notifier.base import Notification, Urgency
+from desktop_notifier.dummy import DummyNotificationCenter
+
+
+class RecordingNotificationCenter(DummyNotificationCenter):
+    """Dummy backend which records batches, replacements and cleared notifications"""
+
+    def __init__(self, notification_limit=None, fail_titles=()):
+        super().__init__(notification_limit=notification_limit)
+        self.fail_titles = set(fail_titles)
+        self.batches = []
+        self.replaced = {}
+        self.cleared = []
+
+    async def _send_many(self, notifications):
+        self.batches.append([n.title for n, _ in notifications])
+        return await super()._send_many(notifications)
+
+    async def _send(self, notification, notification_to_replace):
+        if notification.title in self.fail_titles:
+            raise RuntimeError("Sending failed")
+
+        self.replaced[notification.title] = (
+            notification_to_replace.title if notification_to_replace else None
+        )
+        return await super()._send(notification, notification_to_replace)
+
+    async def _clear(self, notification):
+        self.cleared.append(notification.title)
+
+
+def titles(notifier):
+    return [n.title for n in notifier.current_notifications]
+
+
+async def send_burst(notifier, names):
+    for name in names:
+        await notifier.send(Notification(name, "message"))
+    await notifier.flush()
+
+
+def test_burst_unbounded():
+    notifier = RecordingNotificationCenter()
+
+    asyncio.run(send_burst(notifier, "abcde"))
+
+    assert titles(notifier) == list("abcde")
+    assert notifier.batches == [list("abcde")]
+    assert set(notifier.replaced.values()) == {None}
+
+
+def test_burst_limit_one():
+    notifier = RecordingNotificationCenter(notification_limit=1)
+
+    asyncio.run(send_burst(notifier, "abc"))
+
+    assert titles(notifier) == ["c"]
+    assert notifier.batches == [["a"], ["b"], ["c"]]
+    assert notifier.replaced == {"a": None, "b": "a", "c": "b"}
+
+
+def test_burst_larger_than_limit():
+    notifier = RecordingNotificationCenter(notification_limit=3)
+
+    asyncio.run(send_burst(notifier, "abcdefg"))
+
+    assert titles(notifier) == list("efg")
+    assert notifier.batches == [list("abc"), list("def"), ["g"]]
+    assert notifier.replaced == {
+        "a": None,
+        "b": None,
+        "c": None,
+        "d": "a",
+        "e": "b",
+        "f": "c",
+        "g": "d",
+    }
+
+
+def test_burst_into_partially_filled_cache():
+    notifier = RecordingNotificationCenter(notification_limit=3)
+
+    async def main():
+        await send_burst(notifier, "ab")
+        await send_burst(notifier, "cd")
+
+    asyncio.run(main())
+
+    # Only the last notification of the batch exceeds the limit.
+    assert titles(notifier) == list("bcd")
+    assert notifier.batches == [list("ab"), list("cd")]
+    assert notifier.replaced["c"] is None
+    assert notifier.replaced["d"] == "a"
+
+
+def test_failed_send_leaves_cache_unchanged():
+    notifier = RecordingNotificationCenter(notification_limit=2, fail_titles={"x"})
+    failed = Notification("x", "message")
+
+    async def main():
+        await send_burst(notifier, "ab")
+        cached = list(notifier._notifications.items())
+
+        await notifier.send(failed)
+        await notifier.flush()
+
+        assert failed.identifier is None
+        assert list(notifier._notifications.items()) == cached
+
+        await send_burst(notifier, "c")
+
+    asyncio.run(main())
+
+    assert notifier.replaced["c"] == "a"
+    assert titles(notifier) == list("bc")
+
+
+def test_flush_sets_identifier():
+    notifier = RecordingNotificationCenter()
+    notification = Notification("a", "message")
+
+    async def main():
+        await notifier.send(notification)
+        assert notification.identifier is None
+
+        await notifier.flush()
+
+    asyncio.run(main())
+
+    assert notification.identifier is not None
+    assert notifier._notifications[notification.identifier] is notification
+
+
+@pytest.mark.parametrize("limit", [None, 5])
+def test_concurrent_sends_share_batch(limit):
+    notifier = RecordingNotificationCenter(notification_limit=limit)
+
+    async def main():
+        await asyncio.gather(
+            *(notifier.send(Notification(name, "message")) for name in "abc")
+        )
+        await notifier.flush()
+
+    asyncio.run(main())
+
+    assert notifier.batches == [list("abc")]
+
+
+def test_notification_recorded_before_batch_completes():
+    class BlockingNotificationCenter(RecordingNotificationCenter):
+        async def _send(self, notification, notification_to_replace):
+            if notification.title == "b":
+                await self.release.wait()
+            return await super()._send(notification, notification_to_replace)
+
+    notifier = BlockingNotificationCenter()
+    first = Notification("a", "message")
+
+    async def main():
+        notifier.release = asyncio.Event()
+
+        await notifier.send(first)
+        await notifier.send(Notification("b", "message"))
+        flushing = asyncio.ensure_future(notifier.flush())
+
+        # Let the worker send "a" while "b" is still being sent.
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        try:
+            # A platform callback for "a" must find it while the batch is in progress.
+            assert not flushing.done()
+            assert first.identifier is not None
+            assert notifier._notifications.get(first.identifier) is first
+        finally:
+            notifier.release.set()
+            await flushing
+
+    asyncio.run(main())
+
+    assert notifier.batches == [list("ab")]
+    assert titles(notifier) == list("ab")
+
+
+def test_clear_flushes_first():
+    notifier = RecordingNotificationCenter()
+    notification = Notification("a", "message")
+
+    async def main():
+        await notifier.send(notification)
+        await notifier.clear(notification)
+
+    asyncio.run(main())
+
+    assert notification.identifier is not None
+    assert notifier.cleared == ["a"]
+    assert notifier.current_notifications == ()
+
+
+def test_clear_all_flushes_first():
+    notifier = RecordingNotificationCenter()
+
+    async def main():
+        for name in "abc":
+            await notifier.send(Notification(name, "message"))
+        await notifier.clear_all()
+
+        # Nothing remains queued to be added after clearing.
+        await notifier.flush()
+
+    asyncio.run(main())
+
+    assert notifier.batches == [list("abc")]
+    assert notifier.current_notifications == ()
+
+
+def test_urgency_legacy_name():
+    assert [u.legacy_name for u in Urgency] == ["low", "normal", "critical"]
+
+
+def test_urgency_is_truthy():
+    assert all(Urgency)
+    assert bool(Urgency.Low)
+
+
+def test_urgency_str():
+    assert str(Urgency.Low) == "Urgency.Low"
+    assert f"{Urgency.Critical}" == "Urgency.Critical"
+
+
+def test_urgency_lookup_by_legacy_name_warns():
+    with pytest.warns(DeprecationWarning) as record:
+        assert Urgency("critical") is Urgency.Critical
+
+    assert record[0].filename == __file__
+
+
+def test_urgency_lookup_by_invalid_name():
+    with pytest.raises(ValueError):
+        Urgency("urgent")
+
+
+def test_current_notifications_cached_until_change():
+    notifier = RecordingNotificationCenter()
+
+    asyncio.run(send_burst(notifier, "ab"))
+
+    current = notifier.current_notifications
+    assert isinstance(current, tuple)
+    assert notifier.current_notifications is current
+
+    asyncio.run(send_burst(notifier, "c"))
+
+    assert notifier.current_notifications is not current
+    assert titles(notifier) == list("abc")